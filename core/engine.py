@@ -15,10 +15,218 @@ Description:
     allowing flexible deployment options.
 """
 
+import argparse
+import asyncio
 import json
 import os
-from typing import List, Dict, Optional, Any
+import sys
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import List, Dict, Optional, Any, Protocol
 from pathlib import Path
+from types import MappingProxyType
+
+# JSON helpers used for character files and stored history; _dumps
+# always returns bytes, which Redis accepts directly
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+try:
+    import redis
+except ImportError:  # redis is only needed for the Redis memory backend
+    redis = None
+
+
+class Turn:
+    """
+    A single message in a conversation history.
+    
+    Uses __slots__ to keep long histories compact in memory.
+    """
+    
+    __slots__ = ('sender', 'message', 'target')
+    
+    def __init__(self, sender: str, message: str, target: Optional[str] = None):
+        """
+        Initialize a turn.
+        
+        Args:
+            sender: Who sent the message
+            message: The message content
+            target: Bot the message was addressed to, if any
+        """
+        self.sender = sender
+        self.message = message
+        self.target = target
+    
+    def __repr__(self) -> str:
+        return f"Turn(sender={self.sender!r}, message={self.message!r}, target={self.target!r})"
+    
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Convert the turn to a plain dictionary for serialization."""
+        return {'sender': self.sender, 'message': self.message, 'target': self.target}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Optional[str]]) -> 'Turn':
+        """Rebuild a turn from a dictionary produced by to_dict."""
+        return cls(data['sender'], data['message'], data.get('target'))
+
+
+class MemoryBackend(Protocol):
+    """
+    Storage interface for conversation history.
+    
+    Histories are kept per channel (a sender or bot name) and are bounded,
+    so only the most recent turns of each channel are retained.
+    """
+    
+    def append(self, channel: str, turn: Turn) -> None:
+        """Add a turn to the end of a channel's history."""
+        ...
+    
+    def append_many(self, channels: List[str], turn: Turn) -> None:
+        """Add the same turn to several channels in one operation."""
+        ...
+    
+    def recent(self, channel: str, k: int) -> List[Turn]:
+        """Get the last k turns of a channel, oldest first."""
+        ...
+    
+    def count(self, channel: str) -> int:
+        """Get the number of turns retained for a channel."""
+        ...
+    
+    def set_limit(self, channel: str, maxlen: int) -> None:
+        """Override how many turns are retained for one channel."""
+        ...
+
+
+class InMemoryBackend:
+    """
+    Memory backend that keeps history in process.
+    
+    Fast and dependency-free, but history is lost on restart.
+    """
+    
+    def __init__(self, maxlen: int = 200):
+        """
+        Initialize the in-memory backend.
+        
+        Args:
+            maxlen: Maximum number of turns retained per channel
+        """
+        self.maxlen = maxlen
+        self._channels: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.maxlen))
+    
+    def append(self, channel: str, turn: Turn) -> None:
+        self._channels[channel].append(turn)
+    
+    def append_many(self, channels: List[str], turn: Turn) -> None:
+        for channel in channels:
+            self._channels[channel].append(turn)
+    
+    def recent(self, channel: str, k: int) -> List[Turn]:
+        history = self._channels.get(channel)
+        if not history:
+            return []
+        return list(islice(history, max(0, len(history) - k), len(history)))
+    
+    def count(self, channel: str) -> int:
+        history = self._channels.get(channel)
+        return len(history) if history else 0
+    
+    def set_limit(self, channel: str, maxlen: int) -> None:
+        self._channels[channel] = deque(self._channels.get(channel, ()), maxlen=maxlen)
+
+
+class RedisBackend:
+    """
+    Memory backend that persists history in Redis.
+    
+    Each channel is a Redis list trimmed to the newest turns, so history
+    survives restarts and can be shared between engine instances.
+    """
+    
+    KEY_PREFIX = 'friendforge:hist:'
+    
+    def __init__(self, url: str = 'redis://localhost:6379/0', maxlen: int = 200):
+        """
+        Initialize the Redis backend.
+        
+        Args:
+            url: Redis connection URL
+            maxlen: Maximum number of turns retained per channel
+        """
+        if redis is None:
+            raise ImportError("RedisBackend requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.maxlen = maxlen
+        self._limits: Dict[str, int] = {}  # Per-channel overrides of maxlen
+    
+    def append(self, channel: str, turn: Turn) -> None:
+        self.append_many([channel], turn)
+    
+    def append_many(self, channels: List[str], turn: Turn) -> None:
+        # Serialize once and write every channel in a single round trip
+        data = _dumps(turn.to_dict())
+        pipe = self.client.pipeline()
+        for channel in channels:
+            key = self.KEY_PREFIX + channel
+            limit = self._limits.get(channel, self.maxlen)
+            if limit > 0:
+                pipe.rpush(key, data)
+            self._trim(pipe, key, limit)
+        pipe.execute()
+    
+    def recent(self, channel: str, k: int) -> List[Turn]:
+        if k <= 0:
+            return []
+        raw_turns = self.client.lrange(self.KEY_PREFIX + channel, -k, -1)
+        return [Turn.from_dict(_loads(raw)) for raw in raw_turns]
+    
+    def count(self, channel: str) -> int:
+        return self.client.llen(self.KEY_PREFIX + channel)
+    
+    def set_limit(self, channel: str, maxlen: int) -> None:
+        self._limits[channel] = maxlen
+        self._trim(self.client, self.KEY_PREFIX + channel, maxlen)
+    
+    @staticmethod
+    def _trim(client: Any, key: str, limit: int):
+        """Keep only the newest limit entries of a list (none if limit is 0)."""
+        # LTRIM key -0 -1 would keep the whole list, so clear it instead
+        if limit > 0:
+            client.ltrim(key, -limit, -1)
+        else:
+            client.delete(key)
+
+
+def create_backend(kind: Optional[str] = None, maxlen: int = 200) -> MemoryBackend:
+    """
+    Create the memory backend selected by configuration.
+    
+    Args:
+        kind: 'memory' or 'redis' (defaults to the FRIENDFORGE_MEMORY
+            environment variable, then 'memory')
+        maxlen: Maximum number of turns retained per channel
+        
+    Returns:
+        MemoryBackend instance
+    """
+    kind = kind or os.environ.get('FRIENDFORGE_MEMORY', 'memory')
+    if kind == 'memory':
+        return InMemoryBackend(maxlen=maxlen)
+    if kind == 'redis':
+        url = os.environ.get('FRIENDFORGE_REDIS_URL', 'redis://localhost:6379/0')
+        return RedisBackend(url=url, maxlen=maxlen)
+    raise ValueError(f"Unknown memory backend: {kind}")
 
 
 class Bot:
@@ -29,25 +237,94 @@ class Bot:
     can respond to messages from users or other bots.
     """
     
-    def __init__(self, name: str, config: Dict[str, Any]):
+    def __init__(self, name: str, config: Dict[str, Any],
+                 backend: Optional[MemoryBackend] = None):
         """
         Initialize a bot with name and configuration.
         
         Args:
             name: Unique identifier for the bot
             config: Dictionary containing personality traits, voice style, etc.
+                Optional 'history_window' caps how many turns of this bot's
+                history are retained, and optional 'cache_size' caps the
+                response cache (0 disables it, null uses the default 1024).
+            backend: Shared memory backend for history (None = private
+                in-memory history)
         """
-        self.name = name
+        self.name = sys.intern(name)  # Interned for fast dict lookups
         self.config = config
         self.personality = config.get('personality', {})
         self.voice_style = config.get('voice_style', 'neutral')
         self.quirks = config.get('quirks', [])
-        self.history = []  # Conversation history for this bot
+        self.is_host = config.get('role') == 'host' or 'host' in self.name.lower()
+        # Fixed part of get_info, built once
+        self._info_static = MappingProxyType({
+            'name': self.name,
+            'personality': self.personality,
+            'voice_style': self.voice_style,
+            'quirks': self.quirks
+        })
+        # Conversation history for this bot, bounded to the most recent turns
+        if backend is None:
+            backend = InMemoryBackend()
+        self.backend = backend
+        self._channel = 'bot:' + self.name
+        if 'history_window' in config:
+            window = config['history_window']
+            if isinstance(window, bool) or not isinstance(window, int) or window < 0:
+                raise ValueError(f"history_window for {self.name} must be an integer >= 0, "
+                                 f"got {window!r}")
+            backend.set_limit(self._channel, window)
+        self._reply_prefix = f"[{self.name}] Received message from "
+        # LRU cache of responses keyed by (bot name, sender, message)
+        self._resp_cache: 'OrderedDict[tuple, str]' = OrderedDict()
+        cache_size = config.get('cache_size')
+        if cache_size is None:
+            cache_size = 1024
+        if isinstance(cache_size, bool) or not isinstance(cache_size, int) or cache_size < 0:
+            raise ValueError(f"cache_size for {self.name} must be an integer >= 0, "
+                             f"got {cache_size!r}")
+        self._cache_max = cache_size
     
     def process_message(self, message: str, sender: str) -> str:
         """
         Process incoming message and generate response.
         
+        Args:
+            message: The message content
+            sender: Who sent the message (user or another bot)
+            
+        Returns:
+            Bot's response as a string
+        """
+        self.backend.append(self._channel, Turn(sender, message, None))
+        key = (self.name, sender, message)
+        response = self.get_cached(key)
+        if response is None:
+            response = self.generate_response(message, sender)
+            self.set_cached(key, response)
+        return response
+    
+    async def aprocess_message(self, message: str, sender: str) -> str:
+        """
+        Asynchronously process a message and generate a response.
+        
+        Defaults to the synchronous path; API-backed bots should override
+        this with a non-blocking client so group chats run concurrently.
+        
+        Args:
+            message: The message content
+            sender: Who sent the message (user or another bot)
+            
+        Returns:
+            Bot's response as a string
+        """
+        return self.process_message(message, sender)
+    
+    def generate_response(self, message: str, sender: str) -> str:
+        """
+        Generate a fresh response, bypassing the response cache.
+        
         Args:
             message: The message content
             sender: Who sent the message (user or another bot)
@@ -57,8 +334,49 @@ class Bot:
         """
         # TODO: Implement actual response generation
         # This is a stub that will be expanded with AI logic
-        self.history.append({'sender': sender, 'message': message})
-        return f"[{self.name}] Received message from {sender}: {message}"
+        return self._reply_prefix + sender + ": " + message
+    
+    def get_cached(self, key: tuple) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key, as built by process_message
+            
+        Returns:
+            Cached response, or None on a miss
+        """
+        response = self._resp_cache.get(key)
+        if response is not None:
+            self._resp_cache.move_to_end(key)
+        return response
+    
+    def set_cached(self, key: tuple, response: str):
+        """
+        Store a response, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key, as built by process_message
+            response: Response to cache
+        """
+        if self._cache_max <= 0:
+            return
+        self._resp_cache[key] = response
+        self._resp_cache.move_to_end(key)
+        if len(self._resp_cache) > self._cache_max:
+            self._resp_cache.popitem(last=False)
+    
+    def recent(self, k: int) -> List[Turn]:
+        """
+        Get the last k turns from this bot's history.
+        
+        Args:
+            k: Number of most recent turns to return
+            
+        Returns:
+            List of turns, oldest first
+        """
+        return self.backend.recent(self._channel, k)
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -67,13 +385,63 @@ class Bot:
         Returns:
             Dictionary with bot details
         """
-        return {
-            'name': self.name,
-            'personality': self.personality,
-            'voice_style': self.voice_style,
-            'quirks': self.quirks,
-            'message_count': len(self.history)
-        }
+        return {**self._info_static, 'message_count': self.backend.count(self._channel)}
+
+
+class _NameTrie:
+    """
+    Prefix tree mapping bot names to bots.
+    
+    Finds every bot whose name starts with a given prefix without scanning
+    all registered names.
+    """
+    
+    _END = None  # Child key marking the end of a complete name
+    
+    def __init__(self):
+        self._root: Dict[Optional[str], Any] = {}
+    
+    def insert(self, name: str, bot: Bot):
+        """
+        Add a bot under its name, replacing any bot with the same name.
+        
+        Args:
+            name: Bot name
+            bot: Bot instance
+        """
+        node = self._root
+        for char in name:
+            node = node.setdefault(char, {})
+        node[self._END] = bot
+    
+    def match(self, prefix: str, limit: Optional[int] = None) -> List[Bot]:
+        """
+        Get bots whose names start with a prefix.
+        
+        Args:
+            prefix: Leading part of a bot name
+            limit: Stop after this many matches (None = find all)
+            
+        Returns:
+            List of matching bots
+        """
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        matches = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is self._END:
+                    matches.append(child)
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+                else:
+                    stack.append(child)
+        return matches
 
 
 class MessageRouter:
@@ -84,17 +452,30 @@ class MessageRouter:
     and handles group chat dynamics when multiple bots interact.
     """
     
-    def __init__(self, mode: str = 'local'):
+    CONVERSATION_CHANNEL = 'conversation'  # Backend channel for all turns
+    SENDER_CHANNEL_PREFIX = 'sender:'  # Backend channels for per-sender turns
+    
+    def __init__(self, mode: str = 'local', backend: Optional[MemoryBackend] = None):
         """
         Initialize the message router.
         
         Args:
             mode: Operating mode - 'local' for offline, 'api' for connected
+            backend: Memory backend for conversation history (None = chosen
+                by the FRIENDFORGE_MEMORY environment variable)
         """
         self.bots: Dict[str, Bot] = {}
         self.mode = mode
-        self.conversation_history = []
+        self.backend = backend if backend is not None else create_backend()
         self.host_bot = None  # Special bot that moderates
+        self.group_chat = False
+        # Name -> bot lookup; the None key holds the host route
+        self._dispatch: Dict[Optional[str], Bot] = {}
+        self._default_bot: Optional[Bot] = None  # First registered bot
+        # Bots in registration order, for index-based scoring and fan-out
+        self._bot_list: List[Bot] = []
+        self._active_cache: Optional[tuple] = None  # Cached bot names
+        self._name_trie = _NameTrie()  # For partial-name targets
     
     def register_bot(self, bot: Bot):
         """
@@ -103,9 +484,27 @@ class MessageRouter:
         Args:
             bot: Bot instance to register
         """
+        previous = self.bots.get(bot.name)
+        if previous is None:
+            self._bot_list.append(bot)
+        else:
+            self._bot_list[self._bot_list.index(previous)] = bot
         self.bots[bot.name] = bot
-        if 'host' in bot.name.lower() or bot.config.get('role') == 'host':
+        self._active_cache = None
+        self._dispatch[bot.name] = bot
+        self._name_trie.insert(bot.name, bot)
+        self._default_bot = self._bot_list[0]
+        if bot.is_host:
             self.host_bot = bot
+            self._dispatch[None] = bot
+        elif previous is not None and previous is self.host_bot:
+            # The host was replaced by a non-host bot; fall back to the
+            # most recently registered remaining host, if any
+            self.host_bot = next((b for b in reversed(self._bot_list) if b.is_host), None)
+            if self.host_bot is None:
+                del self._dispatch[None]
+            else:
+                self._dispatch[None] = self.host_bot
     
     def route_message(self, message: str, sender: str = 'user', 
                      target: Optional[str] = None) -> List[Dict[str, str]]:
@@ -115,41 +514,98 @@ class MessageRouter:
         Args:
             message: Message content
             sender: Who sent the message
-            target: Specific bot to target (None = all bots can respond)
+            target: Specific bot to target, by full name or unique name
+                prefix (None = all bots can respond)
             
         Returns:
             List of response dictionaries with 'bot' and 'response' keys
         """
-        self.conversation_history.append({
-            'sender': sender,
-            'message': message,
-            'target': target
-        })
+        # Names repeat on every turn, so share one copy of each
+        sender = sys.intern(sender)
+        target = sys.intern(target) if target else None
+        self._record(Turn(sender, message, target))
         
         responses = []
         
-        # If target specified, route to that bot only
-        if target and target in self.bots:
-            response = self.bots[target].process_message(message, sender)
-            responses.append({'bot': target, 'response': response})
-        else:
-            # TODO: Implement smart routing logic
-            # For now, let host bot respond or first bot if no host
-            responding_bot = self.host_bot if self.host_bot else list(self.bots.values())[0]
-            if responding_bot:
-                response = responding_bot.process_message(message, sender)
-                responses.append({'bot': responding_bot.name, 'response': response})
+        # Targeted bot if known, otherwise host bot or first bot if no host
+        # TODO: Implement smart routing logic
+        responding_bot = self._dispatch.get(target)
+        if responding_bot is None and target:
+            # Two matches are enough to know the prefix is ambiguous
+            candidates = self._name_trie.match(target, limit=2)
+            if len(candidates) == 1:
+                responding_bot = candidates[0]
+        if responding_bot is None:
+            responding_bot = self._dispatch.get(None) or self._default_bot
+        if responding_bot:
+            response = responding_bot.process_message(message, sender)
+            responses.append({'bot': responding_bot.name, 'response': response})
         
         return responses
     
+    def _record(self, turn: Turn):
+        """
+        Store a turn in the full conversation and in its sender's history.
+        
+        Args:
+            turn: Turn to store
+        """
+        self.backend.append_many(
+            [self.CONVERSATION_CHANNEL, self.SENDER_CHANNEL_PREFIX + turn.sender], turn)
+    
+    def recent(self, k: int) -> List[Turn]:
+        """
+        Get the last k turns of the conversation.
+        
+        Args:
+            k: Number of most recent turns to return
+            
+        Returns:
+            List of turns, oldest first
+        """
+        return self.backend.recent(self.CONVERSATION_CHANNEL, k)
+    
+    def recent_from(self, sender: str, k: int) -> List[Turn]:
+        """
+        Get the last k turns sent by one sender.
+        
+        Args:
+            sender: Sender to look up
+            k: Number of most recent turns to return
+            
+        Returns:
+            List of turns, oldest first
+        """
+        return self.backend.recent(self.SENDER_CHANNEL_PREFIX + sender, k)
+    
     def enable_group_chat_mode(self):
         """
         Enable group chat mode where multiple bots can respond and interact.
         
+        Callers check the group_chat flag and send messages through
+        aroute_group instead of route_message while it is set.
+        
         TODO: Implement logic for bots to riff off each other
         """
-        # Stub for future implementation
-        pass
+        self.group_chat = True
+    
+    async def aroute_group(self, message: str, sender: str = 'user') -> List[Dict[str, str]]:
+        """
+        Send a message to every bot concurrently and collect their responses.
+        
+        Args:
+            message: Message content
+            sender: Who sent the message
+            
+        Returns:
+            List of response dictionaries with 'bot' and 'response' keys,
+            in registration order
+        """
+        sender = sys.intern(sender)
+        self._record(Turn(sender, message, None))
+        bots = self._bot_list
+        replies = await asyncio.gather(*(bot.aprocess_message(message, sender) for bot in bots))
+        return [{'bot': bot.name, 'response': reply} for bot, reply in zip(bots, replies)]
     
     def get_active_bots(self) -> List[str]:
         """
@@ -158,15 +614,19 @@ class MessageRouter:
         Returns:
             List of bot names
         """
-        return list(self.bots.keys())
+        if self._active_cache is None:
+            self._active_cache = tuple(self.bots)
+        return list(self._active_cache)
 
 
-def load_characters_from_folder(folder_path: str = './characters') -> List[Dict[str, Any]]:
+def load_characters_from_folder(folder_path: str = './characters',
+                                verbose: bool = True) -> List[Dict[str, Any]]:
     """
     Load all character configuration files from the characters folder.
     
     Args:
         folder_path: Path to the characters directory
+        verbose: Report each loaded character (errors are always reported)
         
     Returns:
         List of character configuration dictionaries
@@ -174,22 +634,42 @@ def load_characters_from_folder(folder_path: str = './characters') -> List[Dict[
     characters = []
     char_folder = Path(folder_path)
     
-    if not char_folder.exists():
-        print(f"Warning: Characters folder '{folder_path}' not found")
+    if not char_folder.is_dir():
+        print(f"Warning: Characters folder '{folder_path}' not found or not a directory")
+        return characters
+    
+    # Load all JSON files from characters folder, overlapping the reads
+    try:
+        with os.scandir(char_folder) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.name.endswith('.json') and entry.is_file()]
+    except OSError as e:
+        print(f"Warning: Characters folder '{folder_path}' could not be read: {e}")
+        return characters
+    if not paths:
         return characters
     
-    # Load all JSON files from characters folder
-    for file_path in char_folder.glob('*.json'):
+    def _load(path: str) -> Any:
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        futures = [executor.submit(_load, path) for path in paths]
+    
+    # Collect messages and write them in one go rather than per file
+    logs = []
+    for file_path, future in zip(paths, futures):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                character_data = json.load(f)
-                characters.append(character_data)
-                print(f"Loaded character: {character_data.get('name', 'Unknown')}")
+            character_data = future.result()
+            characters.append(character_data)
+            if verbose:
+                logs.append(f"Loaded character: {character_data.get('name', 'Unknown')}\n")
         except json.JSONDecodeError as e:
-            print(f"Error loading {file_path}: {e}")
+            logs.append(f"Error loading {file_path}: {e}\n")
         except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+            logs.append(f"Error reading {file_path}: {e}\n")
     
+    sys.stdout.write(''.join(logs))
     return characters
 
 
@@ -201,14 +681,16 @@ def initialize_local_mode(router: MessageRouter, characters: List[Dict[str, Any]
         router: MessageRouter instance
         characters: List of character configurations
     """
-    print("Initializing FriendForge in LOCAL mode (offline)...")
+    logs = ["Initializing FriendForge in LOCAL mode (offline)...\n"]
     
     # Create and register bots from character configs
     for char_config in characters:
-        bot = Bot(char_config.get('name', 'Unknown'), char_config)
+        bot = Bot(char_config.get('name', 'Unknown'), char_config, router.backend)
         router.register_bot(bot)
     
-    print(f"Registered {len(router.get_active_bots())} bots: {', '.join(router.get_active_bots())}")
+    active_bots = router.get_active_bots()
+    logs.append(f"Registered {len(active_bots)} bots: {', '.join(active_bots)}\n")
+    sys.stdout.write(''.join(logs))
     # TODO: Initialize local language model or rule-based responses
 
 
@@ -222,27 +704,38 @@ def initialize_api_mode(router: MessageRouter, characters: List[Dict[str, Any]],
         characters: List of character configurations
         api_config: API configuration (endpoints, keys, etc.)
     """
-    print("Initializing FriendForge in API mode (connected)...")
+    logs = ["Initializing FriendForge in API mode (connected)...\n"]
     
     # Create and register bots from character configs
     for char_config in characters:
-        bot = Bot(char_config.get('name', 'Unknown'), char_config)
+        bot = Bot(char_config.get('name', 'Unknown'), char_config, router.backend)
         router.register_bot(bot)
     
-    print(f"Registered {len(router.get_active_bots())} bots: {', '.join(router.get_active_bots())}")
+    active_bots = router.get_active_bots()
+    logs.append(f"Registered {len(active_bots)} bots: {', '.join(active_bots)}\n")
+    sys.stdout.write(''.join(logs))
     # TODO: Initialize API connections to external AI services
     # TODO: Validate API credentials and endpoints
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """
     Main entry point for FriendForge engine.
     
     Loads characters, initializes the message router, and starts the chat system.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
     """
-    print("="*50)
-    print("FriendForge - The Living Chatbot Ensemble")
-    print("="*50)
+    parser = argparse.ArgumentParser(description="FriendForge - The Living Chatbot Ensemble")
+    parser.add_argument('--mode', default='local',
+                        help="'local' for offline, 'api' for connected (default: local)")
+    parser.add_argument('--group-chat', action='store_true',
+                        help="let every bot respond to each message")
+    args = parser.parse_args(argv)
+    
+    banner = "=" * 50 + "\n"
+    sys.stdout.write(banner + "FriendForge - The Living Chatbot Ensemble\n" + banner)
     
     # Load character configurations
     characters = load_characters_from_folder('./characters')
@@ -252,8 +745,7 @@ def main():
         return
     
     # Initialize message router
-    # TODO: Add command-line arguments to choose mode
-    mode = 'local'  # Default to local mode
+    mode = args.mode
     router = MessageRouter(mode=mode)
     
     # Initialize based on selected mode
@@ -265,17 +757,23 @@ def main():
         print(f"Unknown mode: {mode}")
         return
     
-    print("\nFriendForge engine initialized successfully!")
-    print(f"Active bots: {len(router.get_active_bots())}")
-    print("\nReady for interaction...\n")
+    if args.group_chat:
+        router.enable_group_chat_mode()
     
     # TODO: Start interactive chat loop or connect to interface
     # For now, just demonstrate basic functionality
     test_message = "Hello everyone!"
-    print(f"User: {test_message}")
-    responses = router.route_message(test_message, sender='user')
-    for resp in responses:
-        print(f"{resp['bot']}: {resp['response']}")
+    sys.stdout.write(
+        "\nFriendForge engine initialized successfully!\n"
+        f"Active bots: {len(router.get_active_bots())}\n"
+        "\nReady for interaction...\n\n"
+        f"User: {test_message}\n"
+    )
+    if router.group_chat:
+        responses = asyncio.run(router.aroute_group(test_message, sender='user'))
+    else:
+        responses = router.route_message(test_message, sender='user')
+    sys.stdout.write(''.join(f"{resp['bot']}: {resp['response']}\n" for resp in responses))
 
 
 if __name__ == '__main__':